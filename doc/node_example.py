@@ -24,11 +24,11 @@ class NodeExample(OpenNodeBase):
     ALIM = '5V'
     # The tension of alimentation (will be 5V in most of the case)
 
-    AUTOTEST_AVAILABLE = ['echo']
+    AUTOTEST_AVAILABLE = frozenset(['echo'])
 
-    # The list of autotest available for your node.
+    # The set of autotest available for your node.
     # As describe in the document,
-    # this list must contain at least 'echo'
+    # this set must contain at least 'echo'
 
     def __init__(self):
         pass
@@ -48,7 +48,7 @@ def autotest_checker(*required):
     """Only run tests if required `commands` is implemented.
 
     Allow selecting test launch if the required commads are present in
-    board AUTOTEST_AVAILABLE list. """
+    board AUTOTEST_AVAILABLE set. """
     required = set(required)
 
     def _wrap(func):
@@ -57,9 +57,9 @@ def autotest_checker(*required):
         def _wrapped_f(self, *args, **kwargs):
             """ Function wrapped with test """
             if self.linux_on_class is not None:
-                available = set(self.linux_on_class.AUTOTEST_AVAILABLE)
+                available = self.linux_on_class.AUTOTEST_AVAILABLE
             else:
-                available = set(self.on_class.AUTOTEST_AVAILABLE)
+                available = self.on_class.AUTOTEST_AVAILABLE
             if not required.issubset(available):
                 return 0
 
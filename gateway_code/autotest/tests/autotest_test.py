@@ -156,7 +156,7 @@ class TestAutotestChecker(unittest.TestCase):
 
     def test_autotest_checker(self):
 
-        self.on_class.AUTOTEST_AVAILABLE = ['echo', 'get_time']
+        self.on_class.AUTOTEST_AVAILABLE = frozenset(['echo', 'get_time'])
         self.cn_class.FEATURES = []
         self.linux_on_class = None
 
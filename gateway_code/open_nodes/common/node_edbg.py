@@ -41,11 +41,11 @@ class NodeEdbgBase(OpenNodeBase):
     TTY = '/dev/iotlab/ttyON_CMSIS_DAP'
     BAUDRATE = 115200
 
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time',  # mandatory
         'get_uid',
         'leds_on', 'leds_off', 'leds_blink'
-    ]
+    ])
 
     ALIM = '5V'
 
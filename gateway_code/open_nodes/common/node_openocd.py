@@ -42,11 +42,11 @@ class NodeOpenOCDBase(OpenNodeBase):
     OPENOCD_CLASS = OpenOCD
     OPENOCD_PATH = '/opt/openocd-0.10.0/bin/openocd'
 
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time',  # mandatory
         'get_uid',
         'leds_on', 'leds_off', 'leds_blink'
-    ]
+    ])
 
     ALIM = '5V'
 
@@ -39,7 +39,7 @@ class NodeA8M3(NodeOpenOCDBase):
     FW_IDLE = static_path('a8-m3_idle.elf')
     FW_AUTOTEST = static_path('a8-m3_autotest.elf')
     ALIM = '3.3V'
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time',  # mandatory
         'get_uid',
         'get_accelero', 'get_gyro', 'get_magneto',
@@ -47,7 +47,7 @@ class NodeA8M3(NodeOpenOCDBase):
         'radio_pkt', 'radio_ping_pong',
         'test_pps_start', 'test_pps_get', 'test_pps_stop',
         'leds_on', 'leds_off', 'leds_blink',
-    ]
+    ])
 
     @staticmethod
     def status():
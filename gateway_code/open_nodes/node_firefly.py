@@ -53,12 +53,12 @@ class NodeFirefly(OpenNodeBase):
 
     FIREFLY_CONF = {'port': TTY,
                     'baudrate': PROGRAM_BAUDRATE}
-    AUTOTEST_AVAILABLE = ['echo', 'get_time', 'get_uid',
-                          'leds_on', 'leds_off', 'leds_blink']
+    AUTOTEST_AVAILABLE = frozenset(['echo', 'get_time', 'get_uid',
+                                    'leds_on', 'leds_off', 'leds_blink'])
 
-    # The list of autotest available for your node.
+    # The set of autotest available for your node.
     # As describe in the document,
-    # this list must contain at least 'echo'
+    # this set must contain at least 'echo'
 
     def __init__(self):
         # The initialization of your class
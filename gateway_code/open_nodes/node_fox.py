@@ -39,7 +39,7 @@ class NodeFox(NodeOpenOCDBase):
     FW_IDLE = static_path('fox_idle.elf')
     FW_AUTOTEST = static_path('fox_autotest.elf')
 
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time',  # mandatory
         'get_uid',
         'get_accelero', 'get_gyro', 'get_magneto',
@@ -47,4 +47,4 @@ class NodeFox(NodeOpenOCDBase):
         'leds_on', 'leds_off', 'leds_blink',
         # 'leds_consumption', not precise enough
         # (0.886405, [0.886405, 0.886405, 0.886405, 0.887015])
-    ]
+    ])
@@ -57,10 +57,10 @@ class NodeLeonardo(OpenNodeBase):
         'programmer': 'avr109',
     }
 
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time',  # mandatory
         'get_uid',
-    ]
+    ])
 
     ALIM = '5V'
 
@@ -39,7 +39,7 @@ class NodeM3(NodeOpenOCDBase):
     FW_IDLE = static_path('m3_idle.elf')
     FW_AUTOTEST = static_path('m3_autotest.elf')
     ALIM = '3.3V'
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time',  # mandatory
         'get_uid',
         'get_pressure', 'get_light', 'test_flash',
@@ -48,7 +48,7 @@ class NodeM3(NodeOpenOCDBase):
         'radio_pkt', 'radio_ping_pong',
         'leds_consumption',
         'leds_on', 'leds_off', 'leds_blink',
-    ]
+    ])
 
     @staticmethod
     def status():
@@ -55,9 +55,9 @@ class NodeZigduino(OpenNodeBase):
         'programmer': 'arduino',
     }
 
-    AUTOTEST_AVAILABLE = [
+    AUTOTEST_AVAILABLE = frozenset([
         'echo', 'get_time'  # mandatory
-    ]
+    ])
 
     ALIM = '5V'
 
@@ -83,13 +83,18 @@ def test_registry_open_node():
         """Basic empty OpenNode"""
         TYPE = "my_node"
         ELF_TARGET = ('ELFCLASS32', 'EM_ARM')
-        AUTOTEST_AVAILABLE = ['echo', 'get_time']
+        AUTOTEST_AVAILABLE = frozenset(['echo', 'get_time'])
 
     assert open_node_class("my_node") == MyNode
 
     with pytest.raises(ValueError):
         open_node_class("invalid_node")
 
+    # Autotests are declared as an immutable set
+    for node_class in OpenNodeBase.__registry__.values():
+        autotest = getattr(node_class, 'AUTOTEST_AVAILABLE', None)
+        assert autotest is None or isinstance(autotest, frozenset)
+
 
 def test_registry_control_node():
     """ Verify the control node registry metaclass """
@@ -112,7 +117,7 @@ class BaseOpenNode(OpenNodeBase):
     """parent class with no TYPE attribute"""
     TYPE = "base_open_node"
     ELF_TARGET = ('ELFCLASS32', 'EM_ARM')
-    AUTOTEST_AVAILABLE = ['echo', 'get_time']
+    AUTOTEST_AVAILABLE = frozenset(['echo', 'get_time'])
     TTY = '/dev/iotlab/tty_stlink'
     BAUDRATE = 4242
 
@@ -217,7 +222,7 @@ def test_node_verify_errors():
         # pylint:disable=abstract-method,unused-variable
         """OpenNode with invalid autotest attribute."""
         TYPE = "open_node_invalid_autotest"
-        AUTOTEST_AVAILABLE = ['echo', 'invalid']
+        AUTOTEST_AVAILABLE = frozenset(['echo', 'invalid'])
 
     with pytest.raises(ValueError):
         open_node_class("open_node_invalid_autotest")